@@ -0,0 +1,220 @@
+"""Microphone capture for push-to-talk dictation."""
+import logging
+from threading import Event, Lock, Thread, current_thread
+
+import numpy
+
+# Shares the application's logger, so records reach the console and the UI
+log = logging.getLogger("whisperhotkey")
+
+class AudioRecorder:
+    """Microphone capture that runs from start() until stop(), i.e. while left Ctrl is held."""
+
+    def __init__(self, sample_rate: int = 16000, max_seconds: int = 60,
+                 chunk_seconds: int = 30, on_chunk=None,
+                 silence_ms: int = 0, on_silence=None, silence_threshold: float = 0.01,
+                 blocksize: int = 128):
+        """
+        Args:
+            sample_rate (int): Capture rate in Hz
+            max_seconds (int): Initial buffer length; longer recordings grow it
+            chunk_seconds (int): Length of the chunks handed to on_chunk
+            on_chunk (callable): Called with each complete float32 chunk while the
+                recording is still running; None to only return audio from stop()
+            silence_ms (int): Trailing silence after speech that ends the recording
+                early; 0 to record until stop() is called
+            on_silence (callable): Called with the recorder once that much silence
+                has been heard, typically to stop it
+            silence_threshold (float): RMS level, as a fraction of full scale, below
+                which audio counts as silence
+            blocksize (int): Frames per audio callback, 8 ms at 16 kHz by default
+        """
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
+        self.chunk_samples = sample_rate * chunk_seconds
+        self.on_chunk = on_chunk
+        self.silence_samples = sample_rate * silence_ms // 1000
+        self.on_silence = on_silence
+        self.chunk_count = 0
+        # Compare levels in int16 units so the callback needn't convert to float32
+        self._silence_level = silence_threshold * 32768.0
+        # Pre-allocate one contiguous buffer, reused by every recording; it is only grown
+        # if the key is held for longer than max_seconds. Samples are captured as the
+        # microphone's native int16, half the size of float32, and converted once at the end.
+        self._buffer = numpy.empty(sample_rate * max_seconds, dtype=numpy.int16)
+        self._write_pos = 0
+        self._chunk_start = 0
+        self._heard_speech = False
+        self._silent_samples = 0
+        self._ended = False
+        # Input over/underflows seen by the audio callback, reported when recording stops
+        self._status_count = 0
+        self._last_status = None
+        self._wake = Event()
+        self._stopping = False
+        self._stop_lock = Lock()
+        # Set whenever no recording is running
+        self._idle = Event()
+        self._idle.set()
+        self._stream = None
+        self._feeder = None
+
+    def _callback(self, indata, frames, time, status):
+        """Copy each block of audio data into the buffer"""
+        # This runs on PortAudio's thread, so don't log here: a logging handler may block
+        if status:
+            self._status_count += 1
+            self._last_status = status
+        end = self._write_pos + frames
+        if end > len(self._buffer):
+            self._buffer = numpy.resize(self._buffer, max(end, 2 * len(self._buffer)))
+        # sounddevice reuses indata, so it must be copied; the slice assignment copies
+        # the raw mono samples straight into the flat buffer
+        block = self._buffer[self._write_pos:end]
+        block[:] = numpy.frombuffer(indata, dtype=numpy.int16)
+        self._write_pos = end
+        if end - self._chunk_start >= self.chunk_samples:
+            self._wake.set()
+
+        # Endpointing: once speech has been heard, count the silence that follows it
+        if self.silence_samples and not self._ended:
+            level = numpy.sqrt(numpy.mean(numpy.square(block, dtype=numpy.float32)))
+            if level > self._silence_level:
+                self._heard_speech = True
+                self._silent_samples = 0
+            elif self._heard_speech:
+                self._silent_samples += frames
+                if self._silent_samples >= self.silence_samples:
+                    self._ended = True
+                    self._wake.set()
+
+    def _to_float32(self, start: int, end: int) -> numpy.ndarray:
+        """Convert part of the buffer to float32 in [-1, 1), as Whisper expects"""
+        # Scale in place so the conversion allocates a single float32 array
+        audio = self._buffer[start:end].astype(numpy.float32)
+        audio *= 1.0 / 32768.0
+        return audio
+
+    def _feed_chunks(self):
+        """Hand each complete chunk to on_chunk until the recording stops or goes quiet"""
+        # Runs on its own thread, so the float32 conversion and hand-off stay out of the
+        # audio callback
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self.on_chunk and self._write_pos - self._chunk_start >= self.chunk_samples:
+                end = self._chunk_start + self.chunk_samples
+                self.on_chunk(self._to_float32(self._chunk_start, end))
+                self._chunk_start = end
+                self.chunk_count += 1
+            if self._stopping:
+                return
+            if self._ended:
+                log.info("Silence detected, stopping recording")
+                self.on_silence(self)
+                return
+
+    @property
+    def recording(self) -> bool:
+        """Whether the input stream is running"""
+        return self._stream is not None
+
+    def wait_until_stopped(self):
+        """Block until no recording is running"""
+        self._idle.wait()
+
+    def start(self):
+        """Open the input stream and start recording"""
+        # A stop() still running on the feeder thread finishes with the buffer first
+        with self._stop_lock:
+            self._write_pos = 0
+            self._chunk_start = 0
+            self.chunk_count = 0
+            self._heard_speech = False
+            self._silent_samples = 0
+            self._ended = False
+            self._status_count = 0
+            self._last_status = None
+            self._stopping = False
+            self._wake.clear()
+        # Loading sounddevice loads PortAudio, so it is imported when first needed
+        import sounddevice as sd
+
+        # Open the device before anything else changes state, so if it fails (no
+        # microphone, device busy) the recorder is left idle with no feeder thread.
+        # Small blocks and PortAudio's low-latency setting keep the tail of the recording
+        # from sitting in driver buffers when the key is released.
+        stream = sd.RawInputStream(
+            samplerate=self.sample_rate, channels=1, dtype="int16",
+            blocksize=self.blocksize, latency="low", callback=self._callback,
+        )
+        try:
+            stream.start()
+        except BaseException:
+            stream.close()
+            raise
+        self._idle.clear()
+        if self.on_chunk is not None or (self.silence_samples and self.on_silence is not None):
+            self._feeder = Thread(target=self._feed_chunks, daemon=True)
+            self._feeder.start()
+        self._stream = stream
+        log.info("Recording while left Ctrl is held down...")
+
+    def stop(self):
+        """
+        Stop recording and return the mono float32 audio not yet handed to on_chunk,
+        with the number of chunks that were.
+
+        Returns None if the recording was already stopped, or is being stopped by
+        another thread, e.g. key release racing the silence endpoint.
+        """
+        if not self._stop_lock.acquire(blocking=False):
+            return None
+        try:
+            if self._stream is None:
+                return None
+            # Stopping the stream waits for pending callbacks, so the buffer is complete
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+            if self._feeder is not None:
+                self._stopping = True
+                self._wake.set()
+                # The feeder itself stops the recording when it detects silence
+                if self._feeder is not current_thread():
+                    self._feeder.join()
+                self._feeder = None
+            # Take everything needed from this recording while holding the lock, which
+            # start() waits for before resetting the buffer for the next one
+            audio = self._to_float32(self._chunk_start, self._write_pos)
+            chunk_count = self.chunk_count
+            recorded = self._write_pos
+            status_count, last_status = self._status_count, self._last_status
+            self._idle.set()
+        finally:
+            self._stop_lock.release()
+
+        if status_count:
+            log.warning(f"Error in audio recording: {last_status} ({status_count} blocks affected)")
+        if recorded:
+            log.info(f"Recorded {recorded/self.sample_rate:.2f} seconds of audio")
+        else:
+            log.info("No audio recorded")
+        return audio, chunk_count
+
+def trim_silence(audio: numpy.ndarray, sample_rate: int = 16000, frame_ms: int = 30,
+                 pad_ms: int = 200, threshold: float = 0.01) -> numpy.ndarray:
+    """Cut leading and trailing silence, keeping some padding around the speech"""
+    frame = sample_rate * frame_ms // 1000
+    n_frames = len(audio) // frame
+    if not n_frames:
+        return audio
+    # RMS energy per 30 ms frame; frames above the threshold count as voiced
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    voiced = numpy.flatnonzero(numpy.sqrt(numpy.mean(frames * frames, axis=1)) > threshold)
+    if not voiced.size:
+        return audio[:0]
+    pad = sample_rate * pad_ms // 1000
+    start = max(voiced[0] * frame - pad, 0)
+    end = min((voiced[-1] + 1) * frame + pad, len(audio))
+    return audio[start:end]
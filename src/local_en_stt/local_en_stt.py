@@ -1,246 +1,390 @@
 """Main module."""
 import os
-import re
-import tempfile
+import sys
 import argparse
-from threading import Event
+import functools
+import logging
+import subprocess
+from collections import deque
+from pathlib import Path
 from queue import Queue
+from threading import Event, Thread
+from typing import TYPE_CHECKING
 import numpy
-import pyautogui
-import sounddevice as sd
-import soundfile as sf
-import whisper
+import pyperclip
 from dotenv import load_dotenv
 from pynput import keyboard
 
-from src.local_en_stt.ui.gui_implementation import WhisperHotkeyGUI
+from src.local_en_stt.audio_recorder import AudioRecorder, trim_silence
+from src.local_en_stt.text_processor import DEFAULT_FILLER_WORDS, TextProcessor
 from src.local_en_stt.ui.terminal_implementation import WhisperHotkeyTerminal
 from src.local_en_stt.utils.file_utils import FileUtils
 
-# Create a message queue for UI output
-message_queue = Queue()
+# faster_whisper and tkinter (via the GUI) are slow to import, so they are
+# imported where first used rather than when this module is loaded
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
-# Store original print function
-original_print = print
+# Create a message queue for UI output. Only the UI consumes it, and
+# deque.append/popleft are atomic, so no lock is needed. Bounded, so lines logged
+# before the UI starts draining drop the oldest rather than piling up.
+message_queue = deque(maxlen=1000)
 
-# Custom print function that logs to both console and UI
-def log_message(message):
-    """Send message to both console and UI."""
-    original_print(message)
-    message_queue.put(message)
+class UIQueueHandler(logging.Handler):
+    """Logging handler that forwards formatted records to the UI message queue."""
 
-# Override the default print function
-print = log_message
+    def __init__(self):
+        super().__init__()
+        # Called after each message is queued, so an event-driven UI can wake up to drain it
+        self.notify = None
+
+    def handle(self, record):
+        # Skip the handler lock: deque.append is atomic, and notify may wait on the UI
+        # thread, which must never be kept waiting for a lock held by a logging thread
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            message_queue.append(self.format(record))
+            if self.notify:
+                self.notify()
+        except Exception:
+            self.handleError(record)
+
+class ConsoleHandler(logging.StreamHandler):
+    """Stream handler that can leave flushing to someone else instead of flushing per record."""
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        # Off until a UI that flushes the stream itself turns it on
+        self.defer_flush = False
+
+    def defer_flush_if_redirected(self):
+        """Stop flushing per record when the stream is not a terminal"""
+        # Redirected output is then left to the stream's block buffer instead of costing
+        # a write() per line; a terminal still shows every line as it is logged
+        isatty = getattr(self.stream, "isatty", None)
+        self.defer_flush = not (isatty and isatty())
+
+    def flush(self):
+        if not self.defer_flush:
+            super().flush()
+
+# Application logger that fans out to both console and UI. The level is taken from
+# LOG_LEVEL once the configuration is loaded.
+log = logging.getLogger("whisperhotkey")
+log.setLevel(logging.INFO)
+console_handler = ConsoleHandler(sys.stdout)
+log.addHandler(console_handler)
+ui_log_handler = UIQueueHandler()
+log.addHandler(ui_log_handler)
+log.propagate = False
+
+# Recordings waiting to be transcribed, as (audio, final) pairs where final marks the
+# last piece of an utterance. Unbounded: it is fed from the keyboard listener, whose
+# callbacks must never block the system-wide key hook, and a backlog is only ever a
+# few dictations' worth of audio.
+transcription_queue = Queue()
+
+# Synthesizes the paste shortcut; pynput is already loaded for the hotkey listener.
+# The listener also sees synthesized keys, and on X11 Key.ctrl is the same key as
+# Key.ctrl_l, so paste with right Ctrl to keep it from triggering the left Ctrl hotkey.
+keyboard_controller = keyboard.Controller()
+PASTE_MODIFIER = keyboard.Key.cmd if sys.platform == "darwin" else keyboard.Key.ctrl_r
 
 # App configuration
 APP_NAME = "WhisperHotkey"
 APP_DIR = FileUtils.project_root() / f".{APP_NAME}"
 ENV_FILE = APP_DIR / ".env"
+# Converted models are large and independent of the project, so keep them in the user's
+# cache directory (XDG_CACHE_HOME, ~/.cache by default) rather than in the checkout, and
+# share them between checkouts
+MODELS_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / APP_NAME / "models"
 
 # Default environment configuration
-DEFAULT_ENV = """
+DEFAULT_ENV = f"""
 # Model configuration
 WHISPER_MODEL=small
+# Device (auto, cpu, cuda) and weight precision (auto, int8, int8_float16, float16, float32)
+WHISPER_DEVICE=auto
+WHISPER_COMPUTE_TYPE=auto
 
 # Post-processing configuration
-FILLER_WORDS=um,uh,like,you know,I mean,actually,basically,literally,sort of,kind of,anyway
+FILLER_WORDS={DEFAULT_FILLER_WORDS}
 WORD_REPLACEMENTS=gooey=gui
 CAPITALIZE_FIRST=true
 ADD_FINAL_PUNCTUATION=true
-"""
 
-# Text processing module
-class TextProcessor:
-    def __init__(self):
-        self.replacements = None
-        self.add_punctuation = None
-        self.capitalize_first = None
-        self.filler_words = None
-        self.reload_config()
-
-    def reload_config(self):
-        """Load text processing configuration from environment variables"""
-        # Get filler words from .env or use built-in defaults
-        fillers = os.getenv("FILLER_WORDS", "um,uh,like,you know,I mean,actually,basically,literally,sort of,kind of,anyway")
-
-        # Parse filler words (comma-separated)
-        self.filler_words = [word.strip() for word in fillers.split(",") if word.strip()]
-
-        # Get formatting settings
-        self.capitalize_first = os.getenv("CAPITALIZE_FIRST", "true").lower() == "true"
-        self.add_punctuation = os.getenv("ADD_FINAL_PUNCTUATION", "true").lower() == "true"
-
-        # Parse word replacements
-        replacements = os.getenv("WORD_REPLACEMENTS", "")
-        self.replacements = {}
-        for pair in replacements.split(","):
-            pair = pair.strip()
-            if pair and "=" in pair:
-                wrong, right = pair.split("=", 1)
-                self.replacements[wrong.strip()] = right.strip()
-
-    def process(self, text):
-        """Apply all text processing rules to the input text"""
-        text = text.strip()
-        if not text:
-            return ""
-
-        # Apply filler word removal
-        text = self._remove_fillers(text)
-
-        # Apply word replacements
-        text = self._replace_words(text)
-
-        # Apply formatting
-        text = self._format_text(text)
-
-        return text
-
-    def _remove_fillers(self, text):
-        """Remove filler words from the text"""
-        # Process text for filler word removal
-        for filler in self.filler_words:
-            # Prepare the pattern to match filler words case-insensitively
-            # Note: Using regex with word boundaries to ensure we match whole filler phrases
-            pattern = re.compile(r'\b' + re.escape(filler) + r'\b', re.IGNORECASE)
-
-            # Remove the filler words - including handling punctuation that might follow
-            text = pattern.sub('', text)
-
-            # Also handle the start of sentence case explicitly
-            if text.lower().startswith(filler.lower() + ' '):
-                text = text[len(filler) + 1:]
-
-        # Clean up any resulting artifacts from removal
-        # Fix double spaces
-        while "  " in text:
-            text = text.replace("  ", " ")
-
-        # Fix spaces before punctuation
-        for punct in ['.', ',', '!', '?', ':', ';']:
-            text = text.replace(f" {punct}", punct)
-
-        # Fix leading spaces
-        text = text.strip()
-
-        return text
-
-    def _replace_words(self, text):
-        """Apply word replacements"""
-        for wrong_word, right_word in self.replacements.items():
-            # Replace whole words with word boundaries
-            text = re.sub(r'\b' + re.escape(wrong_word) + r'\b', right_word, text, flags=re.IGNORECASE)
-        return text
-
-    def _format_text(self, text):
-        """Apply text formatting rules"""
-        # Capitalize the first letter if configured and text is not empty
-        if self.capitalize_first and text:
-            text = text[0].upper() + text[1:]
-
-        # Ensure the sentence ends with appropriate punctuation if configured
-        if self.add_punctuation and text and text[-1] not in ".!?":
-            text += "."
-
-        return text
+# Recording configuration
+# Stop recording after this many milliseconds of silence following speech, even if
+# left Ctrl is still held (0 records until it is released)
+AUTO_STOP_SILENCE_MS=0
+
+# Logging configuration (DEBUG, INFO, WARNING, ERROR)
+LOG_LEVEL=INFO
+"""
 
 # Initialize app directory and config file
 def init_app_config():
     """Create an app directory and default configuration if they don't exist."""
     if not APP_DIR.exists():
         APP_DIR.mkdir(parents=True, exist_ok=True)
-        print(f"Created application directory: {APP_DIR}")
+        log.info(f"Created application directory: {APP_DIR}")
 
     if not ENV_FILE.exists():
         with open(ENV_FILE, 'w') as f:
             f.write(DEFAULT_ENV.strip())
-        print(f"Created default configuration file: {ENV_FILE}")
-        print(f"You can edit this file to customize settings.")
+        log.info(f"Created default configuration file: {ENV_FILE}")
+        log.info(f"You can edit this file to customize settings.")
+    else:
+        log.info(f"Using existing configuration: {ENV_FILE}")
+
+def configure_log_level():
+    """Apply LOG_LEVEL from the configuration, keeping INFO if it isn't a known level"""
+    level = os.getenv("LOG_LEVEL", "INFO").strip().upper() or "INFO"
+    # getLevelName maps known names to their number and anything else to a string
+    if isinstance(logging.getLevelName(level), int):
+        log.setLevel(level)
     else:
-        print(f"Using existing configuration: {ENV_FILE}")
+        log.setLevel(logging.INFO)
+        log.warning(f"Unknown LOG_LEVEL {level!r}, using INFO")
+
+def env_int(name: str, default: int) -> int:
+    """Read a non-negative whole number setting, falling back to the default if it is invalid"""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        log.warning(f"Invalid {name} {value!r}, expected a whole number; using {default}")
+        return default
+    return number
 
 # The WhisperHotkeyGUI class has been moved to gui_implementation.py
 
-def load_whisper_model(size: str) -> whisper.Whisper:
-    """Load the Whisper model, downloading it if necessary."""
-    print(f"Loading Whisper model '{size}' (download if missing)...")
-    return whisper.load_model(size)
-
-def record_audio(sample_rate: int = 16000) -> str:
-    """Record audio from the microphone while left Ctrl key is held down."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        # Create a buffer to store audio data
-        audio_chunks = []
-        stop_event = Event()
-
-        # Function to collect audio data in chunks
-        def callback(indata, frames, time, status):
-            if status:
-                print(f"Error in audio recording: {status}")
-            audio_chunks.append(indata.copy())
-
-        # Start the recording stream
-        stream = sd.InputStream(samplerate=sample_rate, channels=1, callback=callback)
-        stream.start()
-
-        print("Recording while left Ctrl is held down...")
-
-        # Wait until the left Ctrl is released
-        with keyboard.Events() as events:
-            for event in events:
-                if isinstance(event, keyboard.Events.Release) and event.key == keyboard.Key.ctrl_l:
-                    break
-
-        # Stop the recording stream
-        stream.stop()
-        stream.close()
-
-        # Combine all audio chunks and save to a file
-        if audio_chunks:
-            recording = numpy.concatenate(audio_chunks, axis=0)
-            sf.write(tmp.name, recording, sample_rate)
-            print(f"Recorded {len(recording)/sample_rate:.2f} seconds of audio")
-            return tmp.name
-        else:
-            print("No audio recorded")
-            return ""
-
-def transcribe_file(path: str) -> str:
-    """Transcribe an audio file using a Whisper model"""
-    # Set fp16=False to prevent FP16 warning on CPU
-    result = model.transcribe(path, language="en", fp16=False)
-    return result["text"].strip()
-
-def on_activate(text_processor):
-    """Handle activation when the Ctrl key is pressed"""
+def convert_whisper_model(size: str, compute_type: str = "int8"):
+    """Return a local CTranslate2 copy of the model stored as compute_type, converting it on first use.
+
+    Returns None if the converter (ctranslate2 + transformers) is not available.
+    """
+    # One copy per precision, so e.g. a GPU run gets real float16 weights rather than
+    # int8 weights widened back to float16
+    model_dir = MODELS_DIR / f"{size}-{compute_type}"
+    if (model_dir / "model.bin").exists():
+        return model_dir
+
+    log.info(f"Converting Whisper model '{size}' to {compute_type} (first run only)...")
+    try:
+        subprocess.run(
+            [
+                "ct2-transformers-converter",
+                "--model", f"openai/whisper-{size}",
+                "--quantization", compute_type,
+                "--output_dir", str(model_dir),
+                "--copy_files", "tokenizer.json", "preprocessor_config.json",
+                "--force",
+            ],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.warning(f"Could not convert Whisper model '{size}', using the downloaded model instead: {e}")
+        return None
+    return model_dir
+
+def physical_cpu_count() -> int:
+    """Return the number of physical CPU cores, or 0 if they can't be counted"""
+    # Hyperthread siblings share caches and slow the GEMM-heavy encoder down, so count
+    # physical cores rather than os.cpu_count()'s logical ones. psutil is optional.
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil and psutil.cpu_count(logical=False):
+        return psutil.cpu_count(logical=False)
+    # Without psutil, Linux lists the hardware threads sharing each core in sysfs; one
+    # distinct list per core. Elsewhere this finds nothing and 0 lets CTranslate2 decide.
+    try:
+        siblings = {
+            path.read_text().strip()
+            for path in Path("/sys/devices/system/cpu").glob("cpu[0-9]*/topology/thread_siblings_list")
+        }
+    except OSError:
+        return 0
+    return len(siblings)
+
+@functools.lru_cache(maxsize=1)
+def load_whisper_model(size: str) -> "WhisperModel":
+    """Load the Whisper model, downloading it if necessary. Repeat calls reuse the loaded model."""
+    import ctranslate2
+    from faster_whisper import WhisperModel
+
+    log.info(f"Loading Whisper model '{size}' (download if missing)...")
+    # Run on a CUDA GPU in float16 when there is one. Otherwise use int8 weights on
+    # the CPU, still much faster than FP32 PyTorch; CTranslate2 only uses 4 threads
+    # unless told otherwise, so use one per physical core. Either choice can be
+    # pinned in the config file.
+    device = os.getenv("WHISPER_DEVICE", "auto").strip().lower() or "auto"
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "auto").strip().lower() or "auto"
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    log.info(f"Running Whisper on {device} ({compute_type})")
+    # A local copy already stored at that precision loads straight from disk with no
+    # download or conversion at startup
+    model_dir = convert_whisper_model(size, compute_type)
+    return WhisperModel(
+        str(model_dir) if model_dir else size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=physical_cpu_count(),
+        local_files_only=model_dir is not None,
+    )
+
+def transcribe_array(audio: numpy.ndarray) -> str:
+    """Transcribe 16 kHz mono float32 audio using a Whisper model"""
+    # Fixing the language and task skips language detection, an extra encoder and
+    # decoder pass. Greedy decoding is plenty for short dictation and much cheaper than
+    # beam search; a single temperature also stops low-confidence windows being decoded again.
+    # The Silero VAD filter drops silence held through before/after speaking, so the
+    # encoder only runs over voiced audio. Each utterance stands alone and only the
+    # text is used, so skip timestamp tokens and conditioning on earlier windows.
+    segments, _ = model.transcribe(
+        audio,
+        language="en",
+        task="transcribe",
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=300),
+        without_timestamps=True,
+        condition_on_previous_text=False,
+    )
+    # Segment texts carry their own leading space
+    return "".join(segment.text for segment in segments).strip()
+
+def type_text(text: str):
+    """Insert text at the cursor by pasting it from the clipboard"""
+    # A single paste shortcut instead of one synthesized keystroke per character
+    pyperclip.copy(text)
+    with keyboard_controller.pressed(PASTE_MODIFIER):
+        keyboard_controller.tap("v")
+
+def warm_up_model(sample_rate: int = 16000):
+    """Run one throwaway transcription so the first real one doesn't pay start-up costs"""
+    # Bypass the VAD filter, which would drop the silence before the encoder runs, and
+    # consume the lazy segment generator so decoding actually happens
+    segments, _ = model.transcribe(numpy.zeros(sample_rate, dtype=numpy.float32), language="en", beam_size=1)
+    list(segments)
+
+def on_activate(recorder):
+    """Start recording when the Ctrl key is pressed"""
     if hasattr(app, 'update_status'):
         app.update_status("Left Ctrl pressed. Starting to record...")
-    print("Left Ctrl pressed. Starting to record...")
-
-    audio_path = record_audio()
-    if audio_path and os.path.exists(audio_path):
+    log.info("Left Ctrl pressed. Starting to record...")
+    try:
+        recorder.start()
+    except Exception as e:
+        # Keep the listener alive; an exception here would stop it
+        log.error(f"Could not start recording: {e}")
+        if hasattr(app, 'update_status'):
+            app.update_status("Could not open the microphone. Press and hold left Ctrl to try again.")
+
+def on_deactivate(recorder):
+    """Stop recording when the Ctrl key is released or speech ends, and queue the audio for transcription"""
+    stopped = recorder.stop()
+    if stopped is None:
+        return
+    audio, chunk_count = stopped
+    # The encoder's cost grows with input length, so don't feed it the silence
+    # before and after speaking
+    audio = trim_silence(audio)
+    if audio.size or chunk_count:
+        # Hand off to the transcription worker so the next utterance can be
+        # recorded while this one is transcribed
+        transcription_queue.put((audio, True))
+    else:
+        log.info("No speech recorded.")
         if hasattr(app, 'update_status'):
-            app.update_status("Transcribing...")
-        print("Transcribing...")
-        text = transcribe_file(audio_path)
-        os.remove(audio_path)
-
-        # Apply text processing
-        cleaned = text_processor.process(text)
-
-        if cleaned:
-            print(f"Typing: {cleaned}")
-            pyautogui.typewrite(cleaned)
-            if hasattr(app, 'update_status'):
-                app.update_status("Ready. Press and hold left Ctrl to record.")
-        else:
-            print("No speech detected.")
-            if hasattr(app, 'update_status'):
-                app.update_status("No speech detected. Press and hold left Ctrl to try again.")
+            app.update_status("No speech recorded. Press and hold left Ctrl to try again.")
+
+def on_chunk(audio):
+    """Queue a complete chunk of a long dictation while recording carries on"""
+    log.debug("Queueing a chunk of the recording for transcription")
+    transcription_queue.put((audio, False))
+
+def type_transcript(text, text_processor, recorder):
+    """Clean up transcribed text and type it"""
+    # Apply text processing
+    cleaned = text_processor.process(text)
+
+    if cleaned:
+        # Don't paste into the middle of the next recording; the synthesized keys
+        # would land while the user is still holding the hotkey
+        recorder.wait_until_stopped()
+        log.info(f"Typing: {cleaned}")
+        type_text(cleaned)
+        if hasattr(app, 'update_status'):
+            app.update_status("Ready. Press and hold left Ctrl to record.")
     else:
-        print("No audio file to transcribe.")
+        log.info("No speech detected.")
         if hasattr(app, 'update_status'):
-            app.update_status("No audio recorded. Press and hold left Ctrl to try again.")
+            app.update_status("No speech detected. Press and hold left Ctrl to try again.")
+
+def transcription_worker(text_processor, recorder):
+    """Transcribe queued recordings one at a time, in the order they were made"""
+    # Long dictations arrive as 30 second chunks queued while the key is still held,
+    # so most of the transcription is done by the time it is released. The chunks'
+    # text is collected and typed in one go once the final piece arrives.
+    parts = []
+    while True:
+        audio, final = transcription_queue.get()
+        try:
+            if final:
+                if hasattr(app, 'update_status'):
+                    app.update_status("Transcribing...")
+                log.info("Transcribing...")
+            if audio.size:
+                parts.append(transcribe_array(audio))
+            if final:
+                type_transcript(" ".join(part for part in parts if part), text_processor, recorder)
+        except Exception as e:
+            log.error(f"Error transcribing audio: {e}")
+        finally:
+            if final:
+                parts = []
+            transcription_queue.task_done()
+
+class HotkeyHandler:
+    """Keyboard listener callbacks that record for as long as left Ctrl is held."""
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        # Set while left Ctrl is held, so key autorepeat can't restart the recording
+        self._held = Event()
+
+    def on_press(self, key):
+        """Start recording on the first left Ctrl press; ignore every other key"""
+        # pynput keys are singletons, so an identity check is the cheapest filter
+        if key is not keyboard.Key.ctrl_l or self._held.is_set():
+            return
+        self._held.set()
+        on_activate(self.recorder)
+
+    def on_release(self, key):
+        """Stop recording once left Ctrl is released, unless silence already stopped it"""
+        if key is not keyboard.Key.ctrl_l or not self._held.is_set():
+            return
+        self._held.clear()
+        if self.recorder.recording:
+            on_deactivate(self.recorder)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -264,6 +408,7 @@ def main() -> None:
 
     # Load environment variables
     load_dotenv(ENV_FILE)
+    configure_log_level()
 
     # Get model size from config
     model_size = os.getenv("WHISPER_MODEL", "small")
@@ -271,33 +416,52 @@ def main() -> None:
     # Initialize the text processor
     text_processor = TextProcessor()
 
-    print(f"Loading Whisper Hotkey application...")
-    print(f"Using configuration from: {ENV_FILE}")
+    log.info(f"Loading Whisper Hotkey application...")
+    log.info(f"Using configuration from: {ENV_FILE}")
 
     # Load the Whisper model
     model = load_whisper_model(model_size)
-    print(f"Loaded Whisper model '{model_size}'")
-    print("Press and hold left Ctrl key to start recording. Release to stop and transcribe.")
+    # Warm-up only saves time; a failure here will show up again on first use
+    try:
+        warm_up_model()
+    except Exception as e:
+        log.warning(f"Could not warm up Whisper model: {e}")
+    log.info(f"Loaded Whisper model '{model_size}'")
+    log.info("Press and hold left Ctrl key to start recording. Release to stop and transcribe.")
 
     # Create the appropriate UI implementation based on arguments
     ui_mode = os.getenv("UI_MODE", "terminal")
     if ui_mode == "terminal":
-        print("Running in terminal mode")
+        log.info("Running in terminal mode")
         app = WhisperHotkeyTerminal(APP_NAME, ENV_FILE)
+        # Log lines already reach the terminal through the console handler, and nothing
+        # drains the UI queue in this mode
+        log.removeHandler(ui_log_handler)
+        message_queue.clear()
+        # The terminal UI flushes stdout on every status change, so redirected log
+        # lines can wait in the buffer until then
+        console_handler.defer_flush_if_redirected()
     else:
-        print("Running in GUI mode")
-        # Create the GUI implementation
-        app = WhisperHotkeyGUI(APP_NAME, ENV_FILE)
-
-    # Start a keyboard listener in a separate thread
-    listener = keyboard.Listener(
-        on_press=lambda key: on_activate(text_processor) if key == keyboard.Key.ctrl_l else None
-    )
-    listener.daemon = True
-    listener.start()
-
-    # Start the UI
-    app.start()
+        log.info("Running in GUI mode")
+        from src.local_en_stt.ui.gui_implementation import WhisperHotkeyGUI
+
+        # Create the GUI implementation, woken by the logger instead of polling
+        app = WhisperHotkeyGUI(APP_NAME, ENV_FILE, message_queue)
+        ui_log_handler.notify = app.notify_log
+
+    # Optionally stop recording once the speaker has gone quiet, without waiting for release
+    silence_ms = env_int("AUTO_STOP_SILENCE_MS", 0)
+    recorder = AudioRecorder(on_chunk=on_chunk, silence_ms=silence_ms, on_silence=on_deactivate)
+
+    # Transcription runs on its own thread, off both the keyboard listener and the UI
+    worker = Thread(target=transcription_worker, args=(text_processor, recorder), daemon=True)
+    worker.start()
+
+    # Run a keyboard listener in a separate thread for as long as the UI is open
+    hotkey = HotkeyHandler(recorder)
+    with keyboard.Listener(on_press=hotkey.on_press, on_release=hotkey.on_release) as listener:
+        # Start the UI; returns once it is closed
+        app.start(listener)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,121 @@
+"""Post-processing applied to Whisper transcriptions before they are typed."""
+import os
+import re
+
+# Built-in filler words, used when FILLER_WORDS is not configured
+DEFAULT_FILLER_WORDS = "um,uh,like,you know,I mean,actually,basically,literally,sort of,kind of,anyway"
+
+# Whitespace artifacts to drop: spaces before punctuation and every space after the
+# first in a run. Joined into TextProcessor's combined pattern.
+_WHITESPACE_CLEANUP = r'(?P<ws> +(?=[.,!?:;])|(?<= ) +)'
+
+# Characters that already end a sentence
+_SENT_ENDS = frozenset('.!?')
+
+class TextProcessor:
+    """Clean up raw transcriptions: drop fillers, apply replacements, fix formatting."""
+
+    def __init__(self) -> None:
+        self.replacements: dict[str, str] = {}
+        self.add_punctuation: bool = False
+        self.capitalize_first: bool = False
+        self.filler_words: tuple[str, ...] = ()
+        self._replacements_ci: dict[str, str] = {}
+        self._cleanup_re: re.Pattern[str] = re.compile(_WHITESPACE_CLEANUP)
+        self._cleanup_ascii_re: re.Pattern[str] = self._cleanup_re
+        self._needs_format: bool = False
+        self.reload_config()
+
+    def reload_config(self) -> None:
+        """Load text processing configuration from environment variables"""
+        # Get filler words from .env or use built-in defaults
+        fillers = os.getenv("FILLER_WORDS", DEFAULT_FILLER_WORDS)
+
+        # Parse filler words (comma-separated) once into an immutable tuple, dropping
+        # case-insensitive duplicates that would only lengthen the alternation
+        filler_words: dict[str, str] = {}
+        for word in fillers.split(","):
+            word = word.strip()
+            if word:
+                filler_words.setdefault(word.lower(), word)
+        self.filler_words = tuple(filler_words.values())
+
+        # Get formatting settings
+        self.capitalize_first = os.getenv("CAPITALIZE_FIRST", "true").lower() == "true"
+        self.add_punctuation = os.getenv("ADD_FINAL_PUNCTUATION", "true").lower() == "true"
+
+        # Parse word replacements
+        replacements = os.getenv("WORD_REPLACEMENTS", "")
+        self.replacements = {}
+        for pair in replacements.split(","):
+            pair = pair.strip()
+            if pair and "=" in pair:
+                wrong, right = pair.split("=", 1)
+                # An empty key would match at every word boundary
+                if wrong.strip():
+                    self.replacements[wrong.strip()] = right.strip()
+
+        # Fillers, replacements and whitespace cleanup are fused into one pattern, compiled
+        # once per config load, so each transcription is processed in a single scan.
+        # Longer fillers go first so e.g. "you know" wins over a shorter filler that
+        # prefixes it. Leading spaces and a directly following comma are consumed with
+        # the filler, so "Um, so" becomes "so" and no gap or stray comma is left.
+        alternatives: list[str] = []
+        if self.filler_words:
+            ordered = sorted(self.filler_words, key=len, reverse=True)
+            alternatives.append(r' *\b(?P<filler>' + '|'.join(re.escape(word) for word in ordered) + r')\b,?')
+        if self.replacements:
+            # Replacements share one alternation too, and are looked up in _replacements_ci
+            # by the matched key; longest first for the same reason as the fillers
+            keys = sorted(self.replacements, key=len, reverse=True)
+            alternatives.append(r'\b(?P<replace>' + '|'.join(re.escape(wrong) for wrong in keys) + r')\b')
+        # Whitespace is tidied even when no fillers or replacements are configured
+        alternatives.append(_WHITESPACE_CLEANUP)
+        pattern = '|'.join(alternatives)
+        self._cleanup_re = re.compile(pattern, re.IGNORECASE)
+        # Case-insensitive matching is much cheaper when the engine only has to fold ASCII.
+        # re.ASCII also narrows \b to ASCII letters, so it is only used on ASCII text,
+        # where it matches exactly what the Unicode pattern would.
+        self._cleanup_ascii_re = re.compile(pattern, re.IGNORECASE | re.ASCII)
+        self._replacements_ci = {wrong.lower(): right for wrong, right in self.replacements.items()}
+        self._needs_format = self.capitalize_first or self.add_punctuation
+
+    def process(self, text: str) -> str:
+        """Apply all text processing rules to the input text"""
+        text = text.strip()
+        if not text:
+            return ""
+
+        # Remove fillers, apply word replacements and tidy whitespace in one pass
+        cleanup_re = self._cleanup_ascii_re if text.isascii() else self._cleanup_re
+        text = cleanup_re.sub(self._substitute, text).strip()
+
+        # Apply formatting
+        if self._needs_format:
+            text = self._format_text(text)
+
+        return text
+
+    def _substitute(self, match: re.Match[str]) -> str:
+        """Return the substitution for one match of the combined cleanup pattern"""
+        if match.lastgroup == 'replace':
+            return self._replacements_ci[match.group('replace').lower()]
+        # Fillers and surplus whitespace are dropped
+        return ''
+
+    def _format_text(self, text: str) -> str:
+        """Apply text formatting rules"""
+        # Cleanup can remove everything, e.g. an utterance that was only fillers
+        if not text:
+            return text
+
+        # Capitalize the first letter if configured; Whisper usually does this already,
+        # so only build a new string when it is actually lowercase
+        if self.capitalize_first and text[0].islower():
+            text = text[0].upper() + text[1:]
+
+        # Ensure the sentence ends with appropriate punctuation if configured
+        if self.add_punctuation and text[-1] not in _SENT_ENDS:
+            text += "."
+
+        return text
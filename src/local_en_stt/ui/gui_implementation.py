@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
-import os
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import scrolledtext
-from queue import Queue
 
 from ui_interface import WhisperHotkeyUI
 
-# This will be imported from the main module
-message_queue = Queue()
+# Default message queue; the main module passes in the one its logger writes to
+message_queue = deque()
+
+# Virtual event raised whenever a message is queued for the log display
+LOG_EVENT = "<<LogMessage>>"
 
 class WhisperHotkeyGUI(WhisperHotkeyUI):
     """
@@ -16,17 +19,22 @@ class WhisperHotkeyGUI(WhisperHotkeyUI):
     Provides a graphical user interface for the WhisperHotkey application.
     """
     
-    def __init__(self, app_name, env_file):
+    def __init__(self, app_name, env_file, messages=None):
         """
         Initialize the GUI.
         
         Args:
             app_name (str): The name of the application
             env_file (str): Path to the environment file
+            messages (collections.deque): Queue of log messages to display
         """
         self.app_name = app_name
         self.env_file = env_file
+        self.messages = message_queue if messages is None else messages
         self.root = None
+        # Set from the first notification until the queue is drained, so a burst of
+        # messages wakes Tk once rather than once per message
+        self._drain_pending = threading.Event()
         
     def setup(self):
         """Set up the GUI components."""
@@ -68,21 +76,41 @@ class WhisperHotkeyGUI(WhisperHotkeyUI):
         )
         self.status_indicator.pack(side="right", padx=5)
 
-        # Start polling for messages
-        self.poll_messages()
+        # Drain the queue whenever a producer signals a new message, and once now for
+        # anything logged before the window existed
+        self.root.bind(LOG_EVENT, self.drain_messages)
+        self.drain_messages()
+
+    def notify_log(self):
+        """
+        Signal that a message has been queued. Safe to call from any thread;
+        Tk wakes up only when there is something to display.
+        """
+        # From another thread event_generate waits for the Tk thread, so skip it when a
+        # drain is already on its way
+        if self.root and not self._drain_pending.is_set():
+            self._drain_pending.set()
+            try:
+                self.root.event_generate(LOG_EVENT, when="tail")
+            except (tk.TclError, RuntimeError):
+                # The window has been closed or its main loop is not running yet;
+                # queued messages are picked up on the next drain
+                self._drain_pending.clear()
         
-    def poll_messages(self):
-        """Check for new messages in the queue and update the display."""
+    def drain_messages(self, event=None):
+        """Move all queued messages into the log display."""
+        # Clear before draining, so a message queued from here on raises a new event
+        self._drain_pending.clear()
         try:
-            while not message_queue.empty():
-                message = message_queue.get_nowait()
-                self.update_log(message)
+            # Single consumer, so a non-empty deque cannot be emptied under us
+            batch = []
+            while self.messages:
+                batch.append(self.messages.popleft())
+            # One insert for the whole batch; the text widget reflows once instead of per line
+            if batch:
+                self.update_log("\n".join(batch))
         except Exception as e:
-            self.update_log(f"Error polling messages: {e}")
-
-        # Schedule the next poll
-        if self.root:
-            self.root.after(100, self.poll_messages)
+            self.update_log(f"Error reading messages: {e}")
 
     def update_log(self, message):
         """
@@ -113,24 +141,21 @@ class WhisperHotkeyGUI(WhisperHotkeyUI):
                 self.status_indicator.config(text="🔄 Processing", fg="blue")
             else:
                 self.status_indicator.config(text="⚪ Idle", fg="black")
-
-    def open_config_file(self):
-        """Open the configuration file for editing."""
-        print(f"Opening configuration file: {self.env_file}")
-        try:
-            # On macOS, use the 'open' command
-            if os.name == 'posix':
-                os.system(f"open {self.env_file}")
-            # On Windows, use the default editor
-            elif os.name == 'nt':
-                os.system(f"start {self.env_file}")
-            else:
-                print(f"Please manually edit the config file at: {self.env_file}")
-        except Exception as e:
-            print(f"Error opening config file: {e}")
             
-    def start(self):
-        """Start the GUI main loop."""
+    def start(self, listener):
+        """
+        Start the GUI main loop.
+        
+        Args:
+            listener (pynput.keyboard.Listener): The running hotkey listener,
+                stopped when the window is closed
+        """
         if not self.root:
             self.setup()
-        self.root.mainloop()
\ No newline at end of file
+
+        def on_close():
+            listener.stop()
+            self.root.destroy()
+
+        self.root.protocol("WM_DELETE_WINDOW", on_close)
+        self.root.mainloop()
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import os
 import sys
 import threading
 from queue import Queue
@@ -36,9 +35,9 @@ class WhisperHotkeyTerminal(WhisperHotkeyUI):
             message (str): The message to display in the log
         """
         # In terminal mode, we just print the message directly
-        # We don't use the overridden print function to avoid recursion
+        # We don't use the overridden print function to avoid recursion.
+        # Log lines are left in the stdout buffer; it is flushed on status changes.
         sys.stdout.write(f"{message}\n")
-        sys.stdout.flush()
         
     def update_status(self, status):
         """
@@ -59,22 +58,11 @@ class WhisperHotkeyTerminal(WhisperHotkeyUI):
             
         # Print the status update
         sys.stdout.write(f"\n--- Status: {indicator} - {status} ---\n")
+        self._flush()
+
+    def _flush(self):
+        """Flush buffered log and status output to the terminal."""
         sys.stdout.flush()
-        
-    def open_config_file(self):
-        """Open the configuration file for editing."""
-        print(f"Opening configuration file: {self.env_file}")
-        try:
-            # On macOS, use the 'open' command
-            if os.name == 'posix':
-                os.system(f"open {self.env_file}")
-            # On Windows, use the default editor
-            elif os.name == 'nt':
-                os.system(f"start {self.env_file}")
-            else:
-                print(f"Please manually edit the config file at: {self.env_file}")
-        except Exception as e:
-            print(f"Error opening config file: {e}")
     
     def _print_header(self):
         """Print the application header."""
@@ -87,14 +75,24 @@ class WhisperHotkeyTerminal(WhisperHotkeyUI):
         print("Speech will be transcribed and typed when you release the key.")
         print("-" * 60 + "\n")
     
-    def start(self):
-        """Start the terminal UI."""
+    def start(self, listener):
+        """
+        Start the terminal UI and block until the keyboard listener stops.
+        
+        Args:
+            listener (pynput.keyboard.Listener): The running hotkey listener
+        """
         self._print_header()
         
-        # In terminal mode, we don't need a main loop like in GUI
-        # We just need to keep the application running
+        # In terminal mode, we don't need a main loop like in GUI.
+        # The listener thread handles keyboard events; the main thread just
+        # waits on it instead of returning and letting the process exit.
         self.running = True
-        
-        # We could add a simple command loop here if needed
-        # For now, we just keep the application running
-        # The main thread will handle keyboard events
\ No newline at end of file
+        self._flush()
+        try:
+            listener.join()
+        except KeyboardInterrupt:
+            listener.stop()
+        finally:
+            self.running = False
+            self._flush()
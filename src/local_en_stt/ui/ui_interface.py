@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import os
+import subprocess
+import sys
 from abc import ABC, abstractmethod
 
 class WhisperHotkeyUI(ABC):
@@ -29,17 +32,35 @@ class WhisperHotkeyUI(ABC):
         """
         pass
     
-    @abstractmethod
     def open_config_file(self):
         """
-        Open the configuration file for editing.
+        Open the configuration file for editing. Shared by all implementations;
+        expects ``self.env_file`` to be set.
         """
-        pass
+        print(f"Opening configuration file: {self.env_file}")
+        try:
+            # Launch the editor without a shell and without waiting for it to exit
+            if sys.platform == 'darwin':
+                subprocess.Popen(["open", str(self.env_file)])
+            # On Windows, use the default editor
+            elif os.name == 'nt':
+                os.startfile(str(self.env_file))
+            # On Linux and other desktops, defer to the XDG default application
+            else:
+                subprocess.Popen(["xdg-open", str(self.env_file)])
+        except FileNotFoundError:
+            print(f"Please manually edit the config file at: {self.env_file}")
+        except Exception as e:
+            print(f"Error opening config file: {e}")
     
     @abstractmethod
-    def start(self):
+    def start(self, listener):
         """
-        Start the UI. This might involve starting a main loop for GUI
-        or just initializing for terminal UI.
+        Start the UI and block until it is closed. This might involve
+        starting a main loop for GUI or waiting on the keyboard listener
+        for terminal UI.
+        
+        Args:
+            listener (pynput.keyboard.Listener): The running hotkey listener
         """
         pass
\ No newline at end of file
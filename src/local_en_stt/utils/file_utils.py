@@ -1,8 +1,14 @@
 import csv
+import functools
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Optional, Iterable, Tuple, Any
 
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 class FileUtils:
     @staticmethod
@@ -11,14 +17,20 @@ class FileUtils:
         Search upwards from start_path (or CWD) for a directory named `target`.
         Raises FileNotFoundError if not found.
         """
-        current = Path(start_path or Path.cwd()).resolve()
+        # Work on plain strings with a single stat per level; Path.exists/is_dir/is_file
+        # would each stat the candidate again
+        current = os.path.realpath(start_path or os.getcwd())
         while True:
-            candidate = current / target
-            if candidate.exists() and (candidate.is_dir() or candidate.is_file()):
-                return candidate
-            if current.parent == current:
+            candidate = os.path.join(current, target)
+            try:
+                os.stat(candidate)
+                return Path(candidate)
+            except OSError:
+                pass
+            parent = os.path.dirname(current)
+            if parent == current:
                 break  # reached root
-            current = current.parent
+            current = parent
         raise FileNotFoundError(f"Directory/file '{target}' not found upwards from {start_path or Path.cwd()}")
 
     @staticmethod
@@ -30,24 +42,55 @@ class FileUtils:
         return FileUtils._find_dir_upwards(path_or_dirname, start_path)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def project_root():
+        # The project root does not move while the process runs, so only walk once
         git_dir = FileUtils._find_dir_upwards(".git")
         return git_dir.parent
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def ds_root():
         return FileUtils.project_root() / "data_sources"
-        
+
 
     @staticmethod
     def csv_dump(filepath: Path, rows: Iterable[Tuple]):
+        """
+        Write rows to a CSV file. Rows are consumed lazily, so pass a generator to
+        stream large dumps without materializing them.
+        """
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with filepath.open("w", newline="") as fh:
+        # A 1 MiB write buffer keeps large dumps to a handful of write syscalls
+        with filepath.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as fh:
             csv.writer(fh).writerows(rows)
 
+    @staticmethod
+    def _replacement_mode(filepath: Path) -> int:
+        """Permission bits for a file written over filepath."""
+        try:
+            return stat.S_IMODE(os.stat(filepath).st_mode)
+        except FileNotFoundError:
+            # The umask can only be read by setting it, so put it straight back
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
     @staticmethod
     def backup_json(filepath: Path, data: Any):
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(json.dumps(data, indent=2, default=str))
\ No newline at end of file
+        # Stream into a temporary file next to the target rather than building the whole
+        # document as a str, then swap it in; a failed dump leaves the old backup intact
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+        try:
+            with open(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=2, default=str)
+            # mkstemp creates the file owner-only; give it the permissions a plain open()
+            # would have left: the old backup's, or the umask default for a new one
+            os.chmod(tmp_path, FileUtils._replacement_mode(filepath))
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import sys
+
 import pytest
 
 """Tests for `local_en_stt` package."""
@@ -20,3 +22,168 @@ def test_content(response):
     """Sample pytest test function with the pytest fixture as an argument."""
     # from bs4 import BeautifulSoup
     # assert 'GitHub' in BeautifulSoup(response.content).title.string
+
+
+@pytest.fixture
+def text_processor(monkeypatch):
+    """TextProcessor built from a known configuration."""
+    from local_en_stt.text_processor import TextProcessor
+
+    monkeypatch.delenv("FILLER_WORDS", raising=False)
+    monkeypatch.setenv("WORD_REPLACEMENTS", "gooey=gui,new york=NYC")
+    monkeypatch.setenv("CAPITALIZE_FIRST", "true")
+    monkeypatch.setenv("ADD_FINAL_PUNCTUATION", "true")
+    return TextProcessor()
+
+
+def test_process_removes_fillers(text_processor):
+    """Fillers go without leaving double spaces or stray commas behind."""
+    assert text_processor.process("um so I, uh, think  you know it works") == "So I, think it works."
+    assert text_processor.process("Um, I mean it works .") == "It works."
+
+
+def test_process_replaces_words(text_processor):
+    """Replacements are case-insensitive and prefer the longest key."""
+    assert text_processor.process("the Gooey in new york") == "The gui in NYC."
+
+
+def test_process_respects_non_ascii_word_boundaries(text_processor):
+    """Fillers and replacement keys don't match inside words with non-ASCII letters."""
+    assert text_processor.process("umé ok") == "Umé ok."
+    assert text_processor.process("the gooeyé, um, gooey") == "The gooeyé, gui."
+
+
+def test_process_empty(text_processor):
+    """Blank or filler-only input yields nothing to type."""
+    assert text_processor.process("   ") == ""
+    assert text_processor.process("um uh") == ""
+
+
+def test_process_tidies_whitespace_without_fillers(monkeypatch):
+    """Whitespace is still cleaned up when no fillers or replacements are configured."""
+    from local_en_stt.text_processor import TextProcessor
+
+    monkeypatch.setenv("FILLER_WORDS", "")
+    monkeypatch.delenv("WORD_REPLACEMENTS", raising=False)
+    monkeypatch.setenv("CAPITALIZE_FIRST", "true")
+    monkeypatch.setenv("ADD_FINAL_PUNCTUATION", "true")
+    assert TextProcessor().process("hello  world .") == "Hello world."
+
+
+class FakeInputStream:
+    """Stands in for sounddevice.RawInputStream; tests call the callback directly."""
+
+    def __init__(self, callback, **kwargs):
+        self.callback = callback
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def np():
+    """numpy, which the audio helpers need."""
+    return pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def audio_recorder(monkeypatch, np):
+    """The audio_recorder module, with the microphone stream stubbed out."""
+    import types
+
+    from local_en_stt import audio_recorder
+
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace(RawInputStream=FakeInputStream))
+    return audio_recorder
+
+
+def feed(recorder, samples, block=1600):
+    """Push int16 samples through the recorder's audio callback block by block."""
+    for start in range(0, len(samples), block):
+        data = samples[start:start + block]
+        recorder._callback(data.tobytes(), len(data), None, None)
+
+
+def test_trim_silence_keeps_padding(np, audio_recorder):
+    """Leading and trailing silence is cut, keeping 200 ms either side of the speech."""
+    frame = 480  # 30 ms at 16 kHz
+    audio = np.zeros(70 * frame, dtype=np.float32)
+    audio[30 * frame:50 * frame] = 0.5
+    trimmed = audio_recorder.trim_silence(audio)
+    assert np.array_equal(trimmed, audio[30 * frame - 3200:50 * frame + 3200])
+
+
+def test_trim_silence_all_silent(np, audio_recorder):
+    """A recording with no speech trims to nothing; one too short to judge is kept."""
+    assert audio_recorder.trim_silence(np.zeros(16000, dtype=np.float32)).size == 0
+    short = np.full(100, 0.5, dtype=np.float32)
+    assert audio_recorder.trim_silence(short) is short
+
+
+def test_recorder_hands_off_chunks(np, audio_recorder):
+    """Complete chunks go to on_chunk in order; stop() returns only the remainder."""
+    chunks = []
+    recorder = audio_recorder.AudioRecorder(chunk_seconds=1, on_chunk=chunks.append)
+    samples = (np.arange(40000) % 1000).astype(np.int16)
+    recorder.start()
+    feed(recorder, samples)
+    audio, chunk_count = recorder.stop()
+
+    assert chunk_count == 2
+    assert [len(chunk) for chunk in chunks] == [16000, 16000]
+    assert len(audio) == 8000
+    joined = np.concatenate([*chunks, audio])
+    assert np.array_equal(joined, samples.astype(np.float32) / 32768.0)
+    assert not recorder.recording
+
+
+def test_recorder_stops_after_trailing_silence(np, audio_recorder):
+    """With endpointing on, silence after speech stops the recording."""
+    import threading
+
+    stopped = threading.Event()
+    results = []
+
+    def on_silence(recorder):
+        results.append(recorder.stop())
+        stopped.set()
+
+    recorder = audio_recorder.AudioRecorder(silence_ms=300, on_silence=on_silence)
+    recorder.start()
+    # Leading silence alone never ends the recording
+    feed(recorder, np.zeros(16000, dtype=np.int16))
+    assert not stopped.wait(0.2)
+    feed(recorder, np.full(8000, 10000, dtype=np.int16))
+    feed(recorder, np.zeros(8000, dtype=np.int16))
+
+    assert stopped.wait(5)
+    audio, _ = results[0]
+    assert len(audio) >= 16000 + 8000 + 4800
+    assert not recorder.recording
+    # The key release that follows finds the recording already stopped
+    assert recorder.stop() is None
+
+
+def test_recorder_stays_idle_when_device_fails(monkeypatch, audio_recorder):
+    """A microphone that can't be opened leaves the recorder idle, not half-started."""
+    import types
+
+    class BrokenInputStream(FakeInputStream):
+        def start(self):
+            raise OSError("device unavailable")
+
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace(RawInputStream=BrokenInputStream))
+    recorder = audio_recorder.AudioRecorder(chunk_seconds=1, on_chunk=lambda chunk: None)
+    with pytest.raises(OSError):
+        recorder.start()
+
+    assert not recorder.recording
+    assert recorder._feeder is None
+    assert recorder._idle.wait(0)
+    assert recorder.stop() is None